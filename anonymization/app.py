@@ -8,8 +8,8 @@ resulting service.
 
 from __future__ import annotations
 
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 from xml.etree import ElementTree as ET
@@ -19,18 +19,24 @@ from flask import (
     Flask,
     Request,
     current_app,
-    render_template_string,
+    render_template,
     request,
 )
+from jinja2 import Environment, Template
 
-from anonymization.pii_anonymizer import PlaceholderManager, anonymize_document
+from anonymization.pii_anonymizer import PlaceholderManager, anonymize_document, is_json
 
 anonymization_bp = Blueprint("anonymization", __name__)
 
 
-@anonymization_bp.before_app_request
-def _configure_upload_limit() -> None:
-    current_app.config.setdefault("MAX_CONTENT_LENGTH", 5 * 1024 * 1024)
+UPLOAD_LIMIT = 5 * 1024 * 1024
+
+
+@anonymization_bp.record_once
+def _configure_upload_limit(state) -> None:
+    state.app.config["MAX_CONTENT_LENGTH"] = UPLOAD_LIMIT
+    # Pasted text arrives as a form field, which Werkzeug otherwise caps at 500 KB.
+    state.app.config["MAX_FORM_MEMORY_SIZE"] = UPLOAD_LIMIT
 
 
 def detect_content_type(filename: str | None, text: str) -> str:
@@ -46,11 +52,13 @@ def detect_content_type(filename: str | None, text: str) -> str:
     if not stripped:
         return "text"
 
-    try:
-        json.loads(stripped)
-        return "json"
-    except json.JSONDecodeError:
-        pass
+    # Only attempt the (possibly multi-megabyte) parse whose opening sigil
+    # matches; bare JSON scalars anonymize identically as plain text.
+    first = stripped[0]
+    if first in "{[":
+        return "json" if is_json(stripped) else "text"
+    if first != "<":
+        return "text"
 
     try:
         ET.fromstring(stripped)
@@ -62,17 +70,13 @@ def detect_content_type(filename: str | None, text: str) -> str:
 def get_source_text(req: Request) -> Tuple[str, str | None]:
     """Extract textual payload and original filename from the request."""
     uploaded = req.files.get("document")
-    text_field = req.form.get("text_input", "").strip()
 
     if uploaded and uploaded.filename:
-        raw = uploaded.read()
-        try:
-            text = raw.decode("utf-8")
-        except UnicodeDecodeError:
-            text = raw.decode("utf-8", errors="ignore")
+        # One decode pass; invalid bytes show up as U+FFFD instead of vanishing.
+        text = uploaded.read().decode("utf-8", errors="replace")
         return text, uploaded.filename
 
-    return text_field, None
+    return req.form.get("text_input", "").strip(), None
 
 
 def format_mapping(mapping: List[Tuple[Tuple[str, str], str]]):
@@ -181,6 +185,12 @@ TEMPLATE = """
 """
 
 
+@lru_cache(maxsize=None)
+def compiled_template(env: Environment) -> Template:
+    """Compiles TEMPLATE once per Jinja environment instead of on every request."""
+    return env.from_string(TEMPLATE)
+
+
 @anonymization_bp.route("/", methods=["GET", "POST"])
 def index():
     original_text, filename = get_source_text(request)
@@ -202,8 +212,8 @@ def index():
 
     output_placeholder = "Anonymized text will appear here after you click Anonymize."
 
-    return render_template_string(
-        TEMPLATE,
+    return render_template(
+        compiled_template(current_app.jinja_env),
         original_text=original_text,
         anonymized_text=anonymized_text,
         detected_type=detected_type,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 
 from flask import Flask, render_template
+from jinja2 import FileSystemBytecodeCache
 
 from anonymization import anonymization_bp
 from productivity import productivity_bp
@@ -10,8 +11,9 @@ from productivity import productivity_bp
 
 def create_app() -> Flask:
     app = Flask(__name__, template_folder="templates")
+    # Reuse compiled templates across restarts and gunicorn workers.
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
     app.secret_key = "rm-productivity-demo"  # Replace with a secure key in production.
-    app.config.setdefault("MAX_CONTENT_LENGTH", 5 * 1024 * 1024)
 
     app.register_blueprint(productivity_bp, url_prefix="/productivity")
     app.register_blueprint(anonymization_bp, url_prefix="/anonymization")
@@ -0,0 +1,38 @@
+"""
+Gunicorn settings for serving the combined toolkit.
+
+    gunicorn -c gunicorn_conf.py "app:create_app()"
+
+The productivity demo keeps its meetings in process memory, so the toolkit
+runs as one worker process with several threads; extra workers would each
+hold their own meetings and reject event ids issued by another worker.
+`post_fork` loads the NER model and Hyperscan database in the worker before it
+serves requests. Loading them in the master instead would start the
+torch/ONNX Runtime thread pools before the fork, which can hang inference in
+the child.
+"""
+
+from __future__ import annotations
+
+import os
+
+bind = f"127.0.0.1:{os.getenv('CDSW_APP_PORT', '8080')}"
+preload_app = True
+# Raise only once productivity meetings live in shared storage.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+# ONNX Runtime and the fast tokenizers release the GIL during inference.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+# First requests may still download the model when preloading is disabled.
+timeout = 120
+
+
+def post_fork(server, worker) -> None:
+    if os.getenv("PII_PRELOAD_MODEL", "1").lower() in {"0", "false", "no"}:
+        return
+
+    from anonymization.pii_anonymizer import load_hyperscan_db, load_ner_pipeline
+
+    server.log.info("Loading NER model in worker %s", worker.pid)
+    load_ner_pipeline()
+    load_hyperscan_db()
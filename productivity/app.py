@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import (
     Blueprint,
     Flask,
     flash,
+    get_flashed_messages,
+    make_response,
     redirect,
-    render_template,
     request,
+    session,
+    stream_template,
     url_for,
 )
+from jinja2 import FileSystemBytecodeCache
 
 from .services import (
     CallAutomation,
@@ -29,6 +36,10 @@ scheduler = SmartScheduler()
 automation = CallAutomation()
 processor = TranscriptProcessor()
 MEETINGS: MeetingRepository = MeetingRepository()
+# Runs the recording/ingest calls alongside summarisation in process_transcript.
+transcript_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="transcript")
+# Distinguishes repository versions across restarts; the pid separates workers.
+_BOOT_ID = secrets.token_hex(4)
 
 
 @productivity_bp.before_app_request
@@ -38,10 +49,22 @@ def _ensure_demo_data() -> None:
 
 @productivity_bp.route("/")
 def dashboard():
-    return render_template(
-        "dashboard.html",
-        meetings=MEETINGS.list_ordered() if MEETINGS else [],
-    )
+    etag = f"{os.getpid():x}-{_BOOT_ID}-{MEETINGS.version}"
+    # Pending flash messages must be rendered (and consumed) even if nothing changed.
+    if "_flashes" not in session and request.if_none_match.contains_weak(etag):
+        response = make_response("", 304)
+    else:
+        # Pop flashes now: the session cookie is sent before the streamed body renders.
+        get_flashed_messages(with_categories=True)
+        response = make_response(
+            stream_template(
+                "dashboard.html",
+                meetings=MEETINGS.list_ordered() if MEETINGS else [],
+            )
+        )
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    return response
 
 
 @productivity_bp.route("/schedule", methods=["POST"])
@@ -94,11 +117,12 @@ def record_notes():
         flash("Select a meeting and add a note.", "error")
         return redirect(url_for("productivity.dashboard"))
 
-    if not MEETINGS or not MEETINGS.get(event_id):
+    meeting = MEETINGS.get(event_id) if MEETINGS else None
+    if not meeting:
         flash("Unknown meeting.", "error")
         return redirect(url_for("productivity.dashboard"))
 
-    MEETINGS.append_note(event_id, note)
+    MEETINGS.append_note(meeting, note)
     flash("Note captured for the meeting.", "success")
     return redirect(url_for("productivity.dashboard"))
 
@@ -113,21 +137,26 @@ def process_transcript():
         flash("Select a valid meeting before uploading a transcript.", "error")
         return redirect(url_for("productivity.dashboard"))
 
-    automation.start_recording(meeting)
-    automation.ingest_transcript(meeting, transcript)
+    ingest = transcript_executor.submit(_record_and_ingest, meeting, transcript)
     summary_payload = processor.summarise(transcript)
+    ingest.result()
 
-    summary_lines = [summary_payload.get("summary", "")]
+    summary = summary_payload.get("summary", "")
     action_items = summary_payload.get("action_items", [])
     if action_items:
-        summary_lines.append("\nAction items:")
-        summary_lines.extend(f"- {item}" for item in action_items)
+        summary += "\n\nAction items:\n- " + "\n- ".join(action_items)
 
-    MEETINGS.update_summary(event_id, "\n".join(summary_lines))
+    MEETINGS.update_summary(meeting, summary)
     flash("Transcript processed and summary attached.", "success")
     return redirect(url_for("productivity.dashboard"))
 
 
+def _record_and_ingest(meeting: Meeting, transcript: str) -> None:
+    # Ingest reads the recording id, so these two stay sequential.
+    automation.start_recording(meeting)
+    automation.ingest_transcript(meeting, transcript)
+
+
 def create_demo_meetings() -> None:
     """Seed the repository with illustrative data."""
     if MEETINGS and MEETINGS.list_ordered():
@@ -145,10 +174,12 @@ def create_demo_meetings() -> None:
 
 def create_productivity_app() -> Flask:
     app = Flask(__name__)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
     app.secret_key = "rm-productivity-demo"  # For flash messages; replace in production.
     app.register_blueprint(productivity_bp, url_prefix="/productivity")
     return app
 
 
 if __name__ == "__main__":
-    create_productivity_app().run(debug=True)
+    debug = os.environ.get("FLASK_DEBUG", "").lower() in {"1", "true", "yes"}
+    create_productivity_app().run(debug=debug)
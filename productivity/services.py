@@ -9,14 +9,23 @@ end to end without external dependencies.
 
 from __future__ import annotations
 
+from bisect import insort
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import uuid
+import re
+import secrets
+
+# Prefix test only (no word boundary), matching the original startswith check.
+_ACTION_RE = re.compile(r"(?:action|follow up|task)", re.IGNORECASE)
+# Runs of text between the boundaries str.splitlines() splits on.
+_LINE_RE = re.compile("[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]+")
+# Only the head of very large transcripts is scanned for a summary/action items.
+MAX_SCAN_CHARS = 1_000_000
 
 
 def _generate_id(prefix: str) -> str:
-    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+    return f"{prefix}-{secrets.token_hex(4)}"
 
 
 @dataclass
@@ -30,6 +39,12 @@ class Meeting:
     notes: List[str] = field(default_factory=list)
     summary: Optional[str] = None
     recording_id: Optional[str] = None
+    # Wall-clock microseconds since 1970-01-01, with no time zone conversion,
+    # so it orders exactly like scheduled_for; an int compares far faster.
+    scheduled_ts: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.scheduled_ts = (self.scheduled_for - datetime(1970, 1, 1)) // timedelta(microseconds=1)
 
 
 class SmartScheduler:
@@ -98,14 +113,21 @@ class TranscriptProcessor:
         """
         Produce a synthetic summary.  Replace with an LLM call and/or Azure AI.
         """
-        if not transcript_text.strip():
+        if not transcript_text or transcript_text.isspace():
             return {"summary": "No transcript provided.", "action_items": []}
 
-        sentences = [line.strip() for line in transcript_text.splitlines() if line.strip()]
-        summary = sentences[0] if sentences else transcript_text[:140]
-        action_items = [
-            sentence for sentence in sentences if sentence.lower().startswith(("action", "follow up", "task"))
-        ]
+        summary: Optional[str] = None
+        action_items: List[str] = []
+        for line in _LINE_RE.finditer(transcript_text, 0, MAX_SCAN_CHARS):
+            sentence = line.group().strip()
+            if not sentence:
+                continue
+            if summary is None:
+                summary = sentence
+            if _ACTION_RE.match(sentence):
+                action_items.append(sentence)
+        if summary is None:
+            summary = transcript_text[:140]
         return {"summary": summary, "action_items": action_items}
 
 
@@ -114,23 +136,34 @@ class MeetingRepository:
 
     def __init__(self) -> None:
         self._meetings: Dict[str, Meeting] = {}
+        # Kept sorted on insert so dashboard renders don't re-sort every meeting.
+        self._ordered: List[Meeting] = []
+        self._version = 0
 
     def add(self, meeting: Meeting) -> Meeting:
+        previous = self._meetings.get(meeting.event_id)
+        if previous is not None:
+            self._ordered.remove(previous)
         self._meetings[meeting.event_id] = meeting
+        insort(self._ordered, meeting, key=lambda item: item.scheduled_ts)
+        self._version += 1
         return meeting
 
     def get(self, event_id: str) -> Optional[Meeting]:
         return self._meetings.get(event_id)
 
+    @property
+    def version(self) -> int:
+        """Incremented on every change, for cheap dashboard cache validation."""
+        return self._version
+
     def list_ordered(self) -> List[Meeting]:
-        return sorted(self._meetings.values(), key=lambda meeting: meeting.scheduled_for)
+        return list(self._ordered)
 
-    def append_note(self, event_id: str, note: str) -> None:
-        meeting = self._meetings.get(event_id)
-        if meeting:
-            meeting.notes.append(note)
+    def append_note(self, meeting: Meeting, note: str) -> None:
+        meeting.notes.append(note)
+        self._version += 1
 
-    def update_summary(self, event_id: str, summary: str) -> None:
-        meeting = self._meetings.get(event_id)
-        if meeting:
-            meeting.summary = summary
+    def update_summary(self, meeting: Meeting, summary: str) -> None:
+        meeting.summary = summary
+        self._version += 1
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from flask import Blueprint, flash, render_template, request
+import os
+
+from flask import Blueprint, flash, get_flashed_messages, request, stream_template
+from jinja2 import FileSystemBytecodeCache
 
 from .services import SummarizationClient, SummarizationError
 
@@ -22,17 +25,21 @@ def index():
             flash(str(exc), "error")
         except Exception as exc:  # pragma: no cover - safeguard
             flash(f"Unexpected error: {exc}", "error")
-    return render_template("summarize.html", original_text=original, summary_text=summary)
+    # Pop flashes now: the session cookie is sent before the streamed body renders.
+    get_flashed_messages(with_categories=True)
+    return stream_template("summarize.html", original_text=original, summary_text=summary)
 
 
 def create_summarize_app():
     from flask import Flask
 
     app = Flask(__name__)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
     app.secret_key = "summarize-demo"
     app.register_blueprint(summarize_bp, url_prefix="/summarize")
     return app
 
 
 if __name__ == "__main__":
-    create_summarize_app().run(debug=True)
+    debug = os.environ.get("FLASK_DEBUG", "").lower() in {"1", "true", "yes"}
+    create_summarize_app().run(debug=debug)
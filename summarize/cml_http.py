@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+"""HTTP retry policy and JSON codec shared by the CML client and deployment script."""
+
+import json
+import os
+from typing import Any, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - optional speed-up
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+MAX_RETRIES = int(os.getenv("CML_MAX_RETRIES", "3"))
+BACKOFF = float(os.getenv("CML_BACKOFF", "1.0"))
+
+
+def retry_policy(status_forcelist: Iterable[int], **overrides: Any) -> Retry:
+    """Exponential backoff with jitter that honours Retry-After on the given statuses."""
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        **overrides,
+    )
+    if hasattr(retry, "backoff_jitter"):  # urllib3 >= 2
+        retry.backoff_jitter = 0.5
+    return retry
+
+
+def pooled_session(retry: Retry) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+def dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
@@ -6,6 +6,11 @@ import sys
 
 import cmlapi
 
+try:  # pragma: no cover - optional speed-up
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 def main() -> None:
     base_url = os.getenv("CML_BASE_URL") or os.getenv("CDSW_API_URL")
@@ -28,7 +33,10 @@ def main() -> None:
     client = cmlapi.default_client(url=api_url, cml_api_key=api_key)
 
     project = client.get_project(project_id=project_ref)
-    print(json.dumps(project.to_dict(), indent=2))
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(project.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        print(json.dumps(project.to_dict(), indent=2))
 
 
 if __name__ == "__main__":
@@ -3,25 +3,142 @@ from __future__ import annotations
 """CML model entrypoint for BART summarisation."""
 
 import os
-from typing import Any, Dict
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
 
-from transformers import pipeline
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 
+try:  # pragma: no cover - optional ONNX Runtime backend
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+except ModuleNotFoundError:  # pragma: no cover
+    ORTModelForSeq2SeqLM = None  # type: ignore[assignment]
 
 MODEL_ID = os.environ.get("BART_MODEL_ID", "facebook/bart-large-cnn")
-_summarizer = pipeline("summarization", model=MODEL_ID)
+# Set to 1 to run the Linear layers as int8 on CPU (~4x smaller weights).
+QUANTIZE = os.environ.get("BART_QUANTIZE", "").lower() in {"1", "true", "yes"}
+# Set to "onnx" (with optimum[onnxruntime] installed) to generate with ONNX Runtime on CPU.
+BACKEND = os.environ.get("BART_BACKEND", "torch").lower()
+# Concurrent requests arriving within MAX_WAIT share one batched generate call.
+MAX_BATCH = 8
+MAX_WAIT = 0.01
+_summarizer = None
+_summarizer_lock = threading.Lock()
+_requests: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+_worker = None
 
 
-def predict(data: Any) -> Dict[str, str]:
-    """Return a concise summary for the provided payload."""
+def _get_summarizer():
+    """Load the pipeline on first use so importing this module stays cheap."""
+
+    global _summarizer
+    if _summarizer is None:
+        with _summarizer_lock:
+            if _summarizer is None:
+                if torch.cuda.is_available():
+                    _summarizer = pipeline(
+                        "summarization",
+                        model=MODEL_ID,
+                        device=0,
+                        torch_dtype=torch.float16,
+                    )
+                elif BACKEND == "onnx" and ORTModelForSeq2SeqLM is not None:
+                    _summarizer = _load_onnx()
+                elif QUANTIZE:
+                    _summarizer = _load_quantized()
+                else:
+                    _summarizer = pipeline("summarization", model=MODEL_ID)
+    return _summarizer
+
+
+def _load_onnx():
+    model = ORTModelForSeq2SeqLM.from_pretrained(MODEL_ID, export=True, provider="CPUExecutionProvider")
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_ID)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+
+def _load_quantized():
+    model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_ID)
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_ID)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+
+def predict(data: Any) -> Dict[str, Any]:
+    """Return a concise summary for the provided payload.
+
+    A payload of {"inputs": [...]} returns {"summaries": [...]} in input order.
+    """
+
+    if isinstance(data, dict) and isinstance(data.get("inputs"), list):
+        texts = [text.strip() if isinstance(text, str) else "" for text in data["inputs"]]
+        if not texts or not all(texts):
+            raise ValueError("Every entry in inputs must contain text to summarise.")
+        futures = [_submit(text) for text in texts]
+        return {"summaries": [future.result() for future in futures]}
 
     if isinstance(data, dict):
         text = data.get("input") or data.get("text")
     else:
         text = data
 
-    if not isinstance(text, str) or not text.strip():
+    text = text.strip() if isinstance(text, str) else ""
+    if not text:
         raise ValueError("Input payload must contain text to summarise.")
 
-    result = _summarizer(text.strip(), max_length=130, min_length=30, do_sample=False)
-    return {"summary": result[0]["summary_text"]}
+    return {"summary": _submit(text).result()}
+
+
+def _submit(text: str) -> Future:
+    future: Future = Future()
+    _ensure_worker()
+    _requests.put((text, future))
+    return future
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is None:
+        with _summarizer_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_drain_requests, name="bart-batcher", daemon=True)
+                _worker.start()
+
+
+def _drain_requests() -> None:
+    while True:
+        batch: List[Tuple[str, Future]] = [_requests.get()]
+        deadline = time.monotonic() + MAX_WAIT
+        while len(batch) < MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _summarise_batch(batch)
+
+
+def _summarise_batch(batch: List[Tuple[str, Future]]) -> None:
+    texts = [text for text, _ in batch]
+    try:
+        summarizer = _get_summarizer()
+        with torch.inference_mode():
+            results = summarizer(
+                texts,
+                batch_size=len(texts),
+                truncation=True,
+                max_length=130,
+                min_length=30,
+                do_sample=False,
+            )
+    except Exception as exc:
+        for _, future in batch:
+            future.set_exception(exc)
+        return
+    for (_, future), result in zip(batch, results):
+        future.set_result(result["summary_text"])
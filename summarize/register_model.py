@@ -3,12 +3,15 @@ from __future__ import annotations
 """Utilities to register and deploy the BART summarizer on CML."""
 
 import argparse
+import gzip
+import io
 import json
 import os
-import shutil
-import tempfile
+import tarfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import requests
 
@@ -20,10 +23,31 @@ try:  # pragma: no cover - optional dependency in local dev environments
 except ModuleNotFoundError:  # pragma: no cover
     cmlapi = None  # type: ignore[assignment]
 
+from summarize.cml_http import dumps, loads, pooled_session, retry_policy
+
 
 BART_MODEL_ID = "facebook/bart-large-cnn"
 DEFAULT_MODEL_NAME = "bart-text-summarizer"
 ARTIFACT_BASENAME = "bart_summarizer"
+_HERE = Path(__file__).resolve().parent
+
+# Environment fallbacks, read once at import so repeated parse_args() calls agree.
+_ENV_URL = os.getenv("CDSW_API_URL") or os.getenv("CML_BASE_URL")
+_ENV_API_KEY = os.getenv("CML_ACCESS_TOKEN") or os.getenv("CDSW_APIV2_KEY")
+_ENV_PROJECT_ID = os.getenv("CDSW_PROJECT_ID")
+_ENV_RUNTIME = os.getenv("CML_RUNTIME_IDENTIFIER")
+
+# The REST calls create resources, so only retry when the server did not act on
+# the request (429/503, connection failures) and never after a read timeout.
+_RETRY = retry_policy((429, 503), read=0)
+
+# Shared so the REST calls of one deployment reuse a single TLS connection.
+_SESSION = pooled_session(_RETRY)
+
+
+_API_V1 = "/api/v1"
+_API_SUFFIXES = (_API_V1, "/api/v2")
+_API_SUFFIX_LEN = len(_API_V1)
 
 
 def _normalise_urls(raw_url: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
@@ -32,32 +56,48 @@ def _normalise_urls(raw_url: Optional[str]) -> Tuple[Optional[str], Optional[str
 
     cleaned = raw_url.rstrip("/")
     rest_base = cleaned
-    if cleaned.endswith("/api/v1"):
-        rest_base = cleaned[: -len("/api/v1")]
-    elif cleaned.endswith("/api/v2"):
-        rest_base = cleaned[: -len("/api/v2")]
+    # Both suffixes have the same length, so one slice strips either.
+    if cleaned.endswith(_API_SUFFIXES):
+        rest_base = cleaned[:-_API_SUFFIX_LEN]
 
-    api_url = rest_base + "/api/v1"
+    api_url = rest_base + _API_V1
     return rest_base, api_url
 
 
-def _build_headers(access_token: Optional[str]) -> Dict[str, str]:
+def _parse_response(response: requests.Response) -> Any:
+    # One status check; the body is decoded once, and only sliced for errors.
+    if response.status_code >= 400:
+        raise requests.HTTPError(
+            f"{response.status_code} {response.reason}: {response.content[:512]!r}",
+            response=response,
+        )
+    return loads(response.content)
+
+
+@lru_cache(maxsize=32)
+def _build_headers(access_token: Optional[str]) -> Mapping[str, str]:
+    """Returns a shared read-only header mapping per token."""
     headers = {"Content-Type": "application/json"}
     if access_token:
         headers["Authorization"] = f"Bearer {access_token}"
-    return headers
+    return MappingProxyType(headers)
 
 
-def register_model_rest(base_url: str, access_token: Optional[str], name: str, description: str = "") -> dict:
+def register_model_rest(
+    base_url: str,
+    access_token: Optional[str],
+    name: str,
+    description: str = "",
+    session: Optional[requests.Session] = None,
+) -> dict:
     payload = {"name": name, "description": description}
-    response = requests.post(
+    response = (session or _SESSION).post(
         f"{base_url}/api/v2/registeredModels",
         headers=_build_headers(access_token),
-        data=json.dumps(payload),
+        data=dumps(payload),
         timeout=30,
     )
-    response.raise_for_status()
-    return response.json()
+    return _parse_response(response)
 
 
 def create_model_version_rest(
@@ -65,20 +105,20 @@ def create_model_version_rest(
     access_token: Optional[str],
     registered_model_id: str,
     model_path: Path,
+    session: Optional[requests.Session] = None,
 ) -> dict:
     payload: Dict[str, object] = {
         "registeredModelId": registered_model_id,
         "sourceType": "local",
-        "sourcePath": str(model_path.resolve()),
+        "sourcePath": _resolved_str(str(model_path)),
     }
-    response = requests.post(
+    response = (session or _SESSION).post(
         f"{base_url}/api/v2/modelVersions",
         headers=_build_headers(access_token),
-        data=json.dumps(payload),
+        data=dumps(payload),
         timeout=30,
     )
-    response.raise_for_status()
-    return response.json()
+    return _parse_response(response)
 
 
 def deploy_model_rest(
@@ -87,78 +127,129 @@ def deploy_model_rest(
     project_id: str,
     model_version_id: str,
     workload_size: str,
+    session: Optional[requests.Session] = None,
 ) -> dict:
     payload = {
         "modelVersionId": model_version_id,
         "targetProject": project_id,
         "deployConfig": {"workloadSize": workload_size},
     }
-    response = requests.post(
+    response = (session or _SESSION).post(
         f"{base_url}/api/v2/modelDeployments",
         headers=_build_headers(access_token),
-        data=json.dumps(payload),
+        data=dumps(payload),
         timeout=30,
     )
-    response.raise_for_status()
-    return response.json()
+    return _parse_response(response)
 
 
 def build_bart_artifact() -> Path:
     """Create a lightweight archive that loads BART lazily at inference time."""
 
-    artifacts_dir = Path(__file__).resolve().parent / "artifacts"
+    artifacts_dir = _HERE / "artifacts"
     artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir) / ARTIFACT_BASENAME
-        tmp_path.mkdir(parents=True, exist_ok=True)
-
-        predict_py = tmp_path / "predict.py"
-        predict_py.write_text(
-            '''from __future__ import annotations
+    predict_source = '''from __future__ import annotations
 
 import os
+import threading
 
-from transformers import pipeline
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 
 MODEL_ID = os.environ.get("BART_MODEL_ID", "facebook/bart-large-cnn")
-_summarizer = pipeline("summarization", model=MODEL_ID)
+QUANTIZE = os.environ.get("BART_QUANTIZE", "").lower() in {"1", "true", "yes"}
+_GEN_KW = {"max_length": 130, "min_length": 30, "do_sample": False}
+_summarizer = None
+_summarizer_lock = threading.Lock()
+
+
+def _load_summarizer():
+    if torch.cuda.is_available():
+        return pipeline("summarization", model=MODEL_ID, device=0, torch_dtype=torch.float16)
+    # Size the pool to the CPUs this process may use, not the host's core count.
+    torch.set_num_threads(int(os.environ.get("OMP_NUM_THREADS") or len(os.sched_getaffinity(0))))
+    if QUANTIZE:
+        model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_ID)
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return pipeline("summarization", model=model, tokenizer=AutoTokenizer.from_pretrained(MODEL_ID))
+    return pipeline("summarization", model=MODEL_ID)
+
+
+def _get_summarizer():
+    global _summarizer
+    if _summarizer is None:
+        with _summarizer_lock:
+            if _summarizer is None:
+                _summarizer = _load_summarizer()
+    return _summarizer
+
+
+# Pay the load and first-call cost while the deployment starts, not on the first request.
+if os.environ.get("BART_WARMUP", "1").lower() not in {"0", "false", "no"}:
+    try:
+        with torch.inference_mode():
+            _get_summarizer()("warmup " * 64, max_length=16, min_length=4, do_sample=False)
+    except Exception:
+        pass
 
 
 def predict(data):
+    if isinstance(data, dict) and isinstance(data.get("inputs"), list):
+        texts = [text.strip() if isinstance(text, str) else "" for text in data["inputs"]]
+        if not texts or not all(texts):
+            raise ValueError("Every entry in inputs must contain text to summarise.")
+        with torch.inference_mode():
+            results = _get_summarizer()(texts, truncation=True, batch_size=len(texts), **_GEN_KW)
+        return {"summaries": [result["summary_text"] for result in results]}
     if isinstance(data, dict):
         text = data.get("input") or data.get("text")
     else:
         text = data
-    if not isinstance(text, str) or not text.strip():
+    text = text.strip() if isinstance(text, str) else ""
+    if not text:
         raise ValueError("Input payload must contain text to summarise.")
-    result = _summarizer(text.strip(), max_length=130, min_length=30, do_sample=False)
+    with torch.inference_mode():
+        result = _get_summarizer()(text, **_GEN_KW)
     return {"summary": result[0]["summary_text"]}
-''',
-            encoding="utf-8",
-        )
-
-        requirements = tmp_path / "requirements.txt"
-        requirements.write_text(
-            "torch>=2.2.0\ntransformers>=4.36.0\n",
-            encoding="utf-8",
-        )
+'''
+    members = {
+        "predict.py": predict_source.encode("utf-8"),
+        "requirements.txt": b"torch>=2.2.0\ntransformers>=4.36.0\n",
+    }
 
-        archive_base = artifacts_dir / ARTIFACT_BASENAME
-        archive_path = Path(
-            shutil.make_archive(
-                str(archive_base),
-                "gztar",
-                root_dir=tmp_path,
-                base_dir=".",
-            )
-        )
+    # Streamed from memory with fixed timestamps, so identical inputs produce a
+    # byte-identical archive.
+    archive_path = artifacts_dir / f"{ARTIFACT_BASENAME}.tar.gz"
+    with open(archive_path, "wb") as raw, gzip.GzipFile(
+        filename="", mode="wb", compresslevel=1, fileobj=raw, mtime=0
+    ) as compressed, tarfile.open(fileobj=compressed, mode="w") as archive:
+        root = tarfile.TarInfo(".")
+        root.type = tarfile.DIRTYPE
+        root.mode = 0o755
+        archive.addfile(root)
+        for name, content in members.items():
+            info = tarfile.TarInfo(f"./{name}")
+            info.size = len(content)
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(content))
 
     return archive_path
 
 
+# The CLI never changes directory, so resolved paths are stable for the process.
+@lru_cache(maxsize=128)
+def _resolved_str(path: str) -> str:
+    return str(Path(path).resolve())
+
+
+@lru_cache(maxsize=8)
+def _relative_to_cwd(path: str) -> str:
+    return str(Path(path).relative_to(Path.cwd()))
+
+
 def ensure_predict_script() -> Path:
-    path = Path(__file__).resolve().parent / "model" / "predict.py"
+    path = _HERE / "model" / "predict.py"
     if not path.exists():
         raise FileNotFoundError(
             "summarize/model/predict.py is missing. Run this script from the project root."
@@ -167,9 +258,12 @@ def ensure_predict_script() -> Path:
 
 
 def resolve_runtime_identifier(client, runtime_identifier: Optional[str]) -> str:
-    if runtime_identifier:
-        return runtime_identifier
+    return runtime_identifier or _ENV_RUNTIME or _first_runtime_identifier(client)
+
 
+@lru_cache(maxsize=8)
+def _first_runtime_identifier(client) -> str:
+    """Looks up the default runtime once per (cached) cmlapi client."""
     response = client.list_runtimes(page_size=1)
     runtimes = getattr(response, "runtimes", [])
     if runtimes:
@@ -180,7 +274,9 @@ def resolve_runtime_identifier(client, runtime_identifier: Optional[str]) -> str
     )
 
 
+@lru_cache(maxsize=4)
 def build_cmlapi_client(api_url: Optional[str], api_key: Optional[str]):
+    """Returns a shared client per (url, key), reusing its SSL context and connection pool."""
     if cmlapi is None:
         return None
 
@@ -196,20 +292,20 @@ def build_cmlapi_client(api_url: Optional[str], api_key: Optional[str]):
 
 
 def deploy_with_cmlapi(args) -> Dict[str, dict]:
-    rest_base, api_url = _normalise_urls(args.url or os.getenv("CDSW_API_URL") or os.getenv("CML_BASE_URL"))
+    rest_base, api_url = _normalise_urls(args.url or _ENV_URL)
     client = build_cmlapi_client(api_url, args.api_key)
     if client is None:
         raise RuntimeError(
             "Unable to initialise cmlapi client. Provide --url/--api-key or set the appropriate environment variables."
         )
 
-    project_id = args.project_id or os.getenv("CDSW_PROJECT_ID")
+    project_id = args.project_id or _ENV_PROJECT_ID
     if not project_id:
         raise ValueError("Provide --project-id or set CDSW_PROJECT_ID before running the script.")
 
     runtime_identifier = resolve_runtime_identifier(client, args.runtime)
     predict_path = ensure_predict_script()
-    relative_predict_path = str(predict_path.relative_to(Path.cwd()))
+    relative_predict_path = _relative_to_cwd(str(predict_path))
 
     model_req = CreateModelRequest(
         project_id=project_id,
@@ -246,12 +342,12 @@ def deploy_with_cmlapi(args) -> Dict[str, dict]:
 
 
 def deploy_with_rest(args) -> Dict[str, dict]:
-    rest_base, api_url = _normalise_urls(args.url or os.getenv("CDSW_API_URL") or os.getenv("CML_BASE_URL"))
+    rest_base, api_url = _normalise_urls(args.url or _ENV_URL)
     if not rest_base:
         raise ValueError("Provide --url or export CML_BASE_URL/ CDSW_API_URL.")
 
-    access_token = args.api_key or os.getenv("CML_ACCESS_TOKEN") or os.getenv("CDSW_APIV2_KEY")
-    project_id = args.project_id or os.getenv("CDSW_PROJECT_ID")
+    access_token = args.api_key or _ENV_API_KEY
+    project_id = args.project_id or _ENV_PROJECT_ID
     if not project_id:
         raise ValueError("Provide --project-id or set CDSW_PROJECT_ID before running the script.")
 
@@ -276,18 +372,18 @@ def parse_args() -> argparse.Namespace:
         default=f"BART summarizer seeded from {BART_MODEL_ID}",
         help="Model description",
     )
-    parser.add_argument("--project-id", default=os.getenv("CDSW_PROJECT_ID"), help="CML project UUID")
+    parser.add_argument("--project-id", default=_ENV_PROJECT_ID, help="CML project UUID")
     parser.add_argument(
         "--url",
-        default=os.getenv("CDSW_API_URL") or os.getenv("CML_BASE_URL"),
+        default=_ENV_URL,
         help="CML control plane base URL (with or without /api/v1)",
     )
     parser.add_argument(
         "--api-key",
-        default=os.getenv("CML_ACCESS_TOKEN") or os.getenv("CDSW_APIV2_KEY"),
+        default=_ENV_API_KEY,
         help="CML personal access token",
     )
-    parser.add_argument("--runtime", default=os.getenv("CML_RUNTIME_IDENTIFIER"), help="Runtime image identifier to build with")
+    parser.add_argument("--runtime", default=_ENV_RUNTIME, help="Runtime image identifier to build with")
     parser.add_argument("--artifact", type=Path, default=None, help="Optional prebuilt archive for REST deployment")
     parser.add_argument("--workload", default="S", help="Deployment workload size when using the REST flow (S/M/L)")
     parser.add_argument("--cpu", type=float, default=2.0, help="vCPU allocation for the deployment")
@@ -1,12 +1,37 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import os
+import random
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import requests
 
+try:  # pragma: no cover - optional dependency for concurrent summarisation
+    import aiohttp
+except ModuleNotFoundError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+
+from .cml_http import BACKOFF, MAX_RETRIES, dumps, loads, pooled_session, retry_policy
+
+
+# Summarisation is idempotent, so POSTs are retried on transient statuses and
+# connection errors; Retry-After from a cold-starting model is honoured.
+_RETRY = retry_policy((408, 429, 500, 502, 503, 504))
+_RETRY_STATUSES = frozenset(_RETRY.status_forcelist)
+# Upper bound on a server's Retry-After; the async sleep runs outside the request timeout.
+MAX_RETRY_AFTER = 30.0
+# Repeat summaries of the same text (re-submits, re-renders) skip the round-trip.
+# Entries are keyed by a digest of the text, so submitted documents are not kept.
+SUMMARY_CACHE_SIZE = 512
+# Text between full stops; the offline fallback only needs the first two.
+_SENTENCE_RE = re.compile(r"[^.]+")
+
 
 class SummarizationError(RuntimeError):
     """Raised when the summarization service fails."""
@@ -35,6 +60,18 @@ class SummarizationClient:
 
     def __init__(self, config: Optional[CMLSummarizationConfig] = None) -> None:
         self.config = config or CMLSummarizationConfig.from_env()
+        # One pooled session per client; its credentials are fixed, so they are
+        # set on the session once instead of being merged into every request.
+        self._auth_headers = self._headers() if self.config else {}
+        self._session = pooled_session(_RETRY)
+        self._session.headers.update(self._auth_headers)
+        # Per instance, so entries are scoped to this client's endpoint and token.
+        self._summaries: "OrderedDict[bytes, str]" = OrderedDict()
+        self._summaries_lock = threading.Lock()
+
+    def cache_clear(self) -> None:
+        with self._summaries_lock:
+            self._summaries.clear()
 
     def summarize(self, text: str) -> str:
         text = text.strip()
@@ -43,29 +80,135 @@ class SummarizationClient:
 
         if self.config:
             try:
-                return self._summarize_via_cml(text)
-            except Exception as exc:  # pragma: no cover - network/runtime handling
+                return self._summarize_cached(text)
+            except (requests.RequestException, ValueError) as exc:  # pragma: no cover - network/runtime handling
                 raise SummarizationError(f"CML summarization failed: {exc}") from exc
 
         return self._fallback_summary(text)
 
-    def _summarize_via_cml(self, text: str) -> str:
+    def summarize_batch(self, texts: Sequence[str]) -> List[str]:
+        """Summarises several texts with one request to the model endpoint."""
+        stripped = [text.strip() for text in texts]
+        if not stripped or not all(stripped):
+            raise SummarizationError("Provide text to summarise.")
+
+        if not self.config:
+            return [self._fallback_summary(text) for text in stripped]
+
+        try:
+            response = self._session.post(
+                self.config.endpoint_url,
+                data=dumps({"inputs": stripped}),
+                timeout=20 + 10 * len(stripped),
+            )
+            response.raise_for_status()
+            data = loads(response.content)
+        except (requests.RequestException, ValueError) as exc:  # pragma: no cover - network/runtime handling
+            raise SummarizationError(f"CML summarization failed: {exc}") from exc
+
+        summaries = data.get("summaries") if isinstance(data, dict) else data
+        if (
+            isinstance(summaries, list)
+            and len(summaries) == len(stripped)
+            and all(isinstance(summary, str) for summary in summaries)
+        ):
+            return [summary.strip() for summary in summaries]
+        raise SummarizationError("Unexpected response payload from CML model.")
+
+    async def summarize_async(self, text: str, session: Optional["aiohttp.ClientSession"] = None) -> str:
+        """Async variant of summarize; pass a session to share its connection pool."""
+        text = text.strip()
+        if not text:
+            raise SummarizationError("Provide text to summarise.")
+        if not self.config:
+            return self._fallback_summary(text)
+        if aiohttp is None:
+            raise SummarizationError("Install aiohttp to summarise asynchronously.")
+
+        if session is not None:
+            return await self._summarize_via_cml_async(session, text)
+        async with self._async_session(1) as owned:
+            return await self._summarize_via_cml_async(owned, text)
+
+    async def summarize_many(self, texts: Sequence[str], concurrency: int = 8) -> List[str]:
+        """Summarises texts concurrently over one connection pool, preserving order."""
+        if not self.config or aiohttp is None:
+            return [await self.summarize_async(text) for text in texts]
+
+        semaphore = asyncio.Semaphore(concurrency)
+        async with self._async_session(concurrency) as session:
+
+            async def _one(text: str) -> str:
+                async with semaphore:
+                    return await self.summarize_async(text, session)
+
+            return list(await asyncio.gather(*(_one(text) for text in texts)))
+
+    def _async_session(self, limit: int) -> "aiohttp.ClientSession":
+        # Sessions are bound to the running event loop, so one is opened per call.
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=20),
+        )
+
+    async def _summarize_via_cml_async(self, session: "aiohttp.ClientSession", text: str) -> str:
+        # Mirrors the sync adapter's Retry policy: backoff with jitter, Retry-After honoured.
+        attempt = 0
+        while True:
+            delay: Optional[float] = None
+            try:
+                async with session.post(
+                    self.config.endpoint_url, headers=self._auth_headers, data=dumps({"input": text})
+                ) as response:
+                    if response.status in _RETRY_STATUSES and attempt < MAX_RETRIES:
+                        delay = _retry_after(response.headers.get("Retry-After"))
+                    else:
+                        response.raise_for_status()
+                        return self._parse_summary(loads(await response.read()))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if attempt >= MAX_RETRIES:
+                    raise SummarizationError(f"CML summarization failed: {exc}") from exc
+            except (aiohttp.ClientResponseError, ValueError) as exc:
+                raise SummarizationError(f"CML summarization failed: {exc}") from exc
+            if delay is None:
+                delay = BACKOFF * (2**attempt) + random.uniform(0, 0.5)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _summarize_cached(self, text: str) -> str:
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._summaries_lock:
+            summary = self._summaries.get(key)
+            if summary is not None:
+                self._summaries.move_to_end(key)
+                return summary
+
+        summary = self._summarize_via_cml(text)
+        with self._summaries_lock:
+            self._summaries[key] = summary
+            if len(self._summaries) > SUMMARY_CACHE_SIZE:
+                self._summaries.popitem(last=False)
+        return summary
+
+    def _headers(self) -> Dict[str, str]:
         headers: Dict[str, str] = {"Content-Type": "application/json"}
         if self.config.access_token:
             headers["Authorization"] = f"Bearer {self.config.access_token}"
         if self.config.project_key:
             headers["X-Project-Key"] = self.config.project_key
+        return headers
 
+    def _summarize_via_cml(self, text: str) -> str:
         payload: Dict[str, Any] = {"input": text}
-        response = requests.post(
+        response = self._session.post(
             self.config.endpoint_url,
-            headers=headers,
-            data=json.dumps(payload),
+            data=dumps(payload),
             timeout=20,
         )
         response.raise_for_status()
+        return self._parse_summary(loads(response.content))
 
-        data = response.json()
+    def _parse_summary(self, data: Any) -> str:
         if isinstance(data, dict):
             summary = data.get("summary") or data.get("output")
             if isinstance(summary, str):
@@ -76,9 +219,21 @@ class SummarizationClient:
         raise SummarizationError("Unexpected response payload from CML model.")
 
     def _fallback_summary(self, text: str) -> str:
-        sentences = [s.strip() for s in text.replace("\n", " ").split(".") if s.strip()]
+        sentences: List[str] = []
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().replace("\n", " ").strip()
+            if sentence:
+                sentences.append(sentence)
+                if len(sentences) == 2:
+                    break
         if not sentences:
             return text
-        if len(sentences) == 1:
-            return sentences[0]
-        return ". ".join(sentences[:2]) + "."
+        # A lone sentence keeps its original form, without a trailing full stop.
+        return ". ".join(sentences) + ("." if len(sentences) == 2 else "")
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return min(max(0.0, float(value)), MAX_RETRY_AFTER) if value else None
+    except ValueError:
+        return None
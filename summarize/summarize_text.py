@@ -16,7 +16,8 @@ def main() -> None:
     if args.text:
         payload = args.text
     else:
-        payload = sys.stdin.read().strip()
+        # SummarizationClient.summarize strips the text; no need to copy it here first.
+        payload = sys.stdin.read()
 
     client = SummarizationClient()
     try:
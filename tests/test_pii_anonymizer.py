@@ -0,0 +1,20 @@
+import unittest
+
+from anonymization.pii_anonymizer import PlaceholderManager, anonymize_text
+
+
+def no_entities(texts, **kwargs):
+    return [[] for _ in texts]
+
+
+class RegexDetectionTests(unittest.TestCase):
+    def test_rejected_phone_match_does_not_hide_credit_card(self):
+        text = "box 12 4111111111111111 thanks"
+        self.assertEqual(
+            anonymize_text(text, PlaceholderManager(), no_entities),
+            "box 12 [CREDIT_CARD_1]thanks",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()